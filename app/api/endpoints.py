@@ -1,13 +1,17 @@
 from typing import Annotated, Optional, List
 
 from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi.routing import APIRoute
 
 from app.api.deps import get_context_builder_service
+from app.api.routing import TimedRoute
 from app.services.context_builder import ContextBuilderService
 from app.schemas.metadata import AppMetadataResponse, MultiAppMetadataResponse
-from app.core.logging import logger
+from app.core.config import settings
+from app.core.logging import logger, annotate_access_log
 
-router = APIRouter()
+# Serialization timing is only wired in when profiling is enabled
+router = APIRouter(route_class=TimedRoute if settings.profiling_active else APIRoute)
 
 
 @router.get("/context", response_model=AppMetadataResponse)
@@ -20,6 +24,7 @@ async def get_metadata_context(
     Get AI-ready metadata context with Natural Language summaries.
     """
     logger.info("Fetching metadata context for app", app_name=app_name, schema=schema)
+    annotate_access_log(app_name=app_name)
 
     return await service.build_app_context(
         app_name=app_name,
@@ -46,6 +51,7 @@ async def get_multi_app_metadata_context(
         raise HTTPException(status_code=400, detail="Duplicate app names are not allowed")
 
     logger.info("Fetching metadata context for multiple apps", app_names=app_names)
+    annotate_access_log(app_name=",".join(app_names))
 
     apps = await service.build_multi_app_context(
         app_names=app_names,
@@ -1,7 +1,7 @@
 import os
 from typing import Any, Dict, List, Optional, Union
 
-from pydantic import AnyHttpUrl, PostgresDsn, field_validator, ValidationInfo
+from pydantic import AnyHttpUrl, Field, PostgresDsn, field_validator, ValidationInfo
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -15,6 +15,13 @@ class Settings(BaseSettings):
     API_V1_STR: str = "/api/v1"
     ENV: str = "development"
     LOG_LEVEL: str = "INFO"
+    LOG_QUEUE_SIZE: int = 10000  # records buffered for the writer thread; overflow is dropped
+    LOG_STATS_INTERVAL: float = 10.0  # seconds between logging-cost reports; 0 disables
+
+    # Access Log Settings
+    ACCESS_LOG_ENABLED: bool = True
+    ACCESS_LOG_SAMPLE_RATE: float = Field(1.0, ge=0.0, le=1.0)  # fraction of fast successful requests logged
+    ACCESS_LOG_SLOW_MS: float = 1000.0  # requests at least this slow are always logged
 
     # Database Settings
     DB_HOST: str
@@ -27,6 +34,25 @@ class Settings(BaseSettings):
     
     SQLALCHEMY_DATABASE_URI: Optional[PostgresDsn] = None
 
+    # Response Compression Settings
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MINIMUM_SIZE: int = 500  # bytes; smaller bodies are sent as-is
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_ZSTD_LEVEL: int = 3
+    COMPRESSION_CACHE_MAX_BYTES: int = 32 * 1024 * 1024  # total compressed bytes kept for repeated hits
+    COMPRESSION_CACHE_MAX_ENTRY_BYTES: int = 4 * 1024 * 1024  # larger compressed bodies are not cached
+    COMPRESSION_THREADPOOL_MIN_SIZE: int = 64 * 1024  # bodies this large are compressed off the event loop
+
+    # Profiling Settings (opt-in; requests must send PROFILING_HEADER with PROFILING_TOKEN)
+    # When disabled, no profiling middleware or timed routes are installed; the service's
+    # timed() phases cost one contextvar lookup each. While a request is being profiled,
+    # cProfile instruments the whole event-loop thread, slowing concurrent requests too.
+    # Enable it on a single instance while investigating.
+    PROFILING_ENABLED: bool = False
+    PROFILING_HEADER: str = "X-DQ-Profile"
+    PROFILING_TOKEN: Optional[str] = None
+    PROFILING_OUTPUT_DIR: str = "/tmp/dq-metadata-profiles"
+
     @field_validator("SQLALCHEMY_DATABASE_URI", mode="before")
     def assemble_db_connection(cls, v: Optional[str], info: ValidationInfo) -> Any:
         if isinstance(v, str):
@@ -42,6 +68,10 @@ class Settings(BaseSettings):
             path=f"{values.get('DB_NAME') or ''}",
         )
 
+    @property
+    def profiling_active(self) -> bool:
+        return self.PROFILING_ENABLED and bool(self.PROFILING_TOKEN)
+
     model_config = SettingsConfigDict(
         case_sensitive=True,
         env_file=".env",
@@ -1,15 +1,205 @@
 import logging
+import logging.handlers
+import queue
 import sys
-from typing import Any, Dict
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
+from typing import Any, Dict, Optional
 
 import structlog
 from app.core.config import settings
 
 
+# Per-request fields collected for the access log (set by AccessLogMiddleware)
+access_log_fields: ContextVar[Optional[Dict[str, Any]]] = ContextVar("access_log_fields", default=None)
+
+
+@dataclass
+class AccessLogStats:
+    """Counters for measuring access-logging cost under load."""
+    requests: int = 0
+    logged: int = 0
+    sampled_out: int = 0
+    log_time_ns: int = 0
+
+    def __sub__(self, other: "AccessLogStats") -> "AccessLogStats":
+        return AccessLogStats(
+            requests=self.requests - other.requests,
+            logged=self.logged - other.logged,
+            sampled_out=self.sampled_out - other.sampled_out,
+            log_time_ns=self.log_time_ns - other.log_time_ns,
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "logged": self.logged,
+            "sampled_out": self.sampled_out,
+            "avg_log_cost_us": round(self.log_time_ns / self.logged / 1000, 2) if self.logged else 0.0,
+        }
+
+
+# Updated by AccessLogMiddleware, reported periodically by LogWriter
+access_log_stats = AccessLogStats()
+
+# Share of the log queue kept free for WARNING and above when it fills up
+LOG_QUEUE_RESERVED_FRACTION = 0.1
+
+# Minimum seconds between "records dropped" reports from the writer thread
+DROPPED_REPORT_INTERVAL = 1.0
+
+# Seconds shutdown waits for the writer to drain before giving up on a stalled stream
+LOG_WRITER_STOP_TIMEOUT = 5.0
+
+_stream_handler: Optional[logging.Handler] = None
+_queue_handler: Optional["DroppingQueueHandler"] = None
+_log_writer: Optional["LogWriter"] = None
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """
+    Hands records to the background writer thread without ever blocking the caller.
+
+    Rendering is left to the writer's formatter. When the queue fills (e.g. stdout is
+    stalled) records below WARNING are dropped first, leaving `reserved` slots for
+    warnings and errors; dropped records are counted.
+    """
+
+    def __init__(self, log_queue: queue.Queue, reserved: int):
+        super().__init__(log_queue)
+        self.soft_limit = max(log_queue.maxsize - reserved, 1)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if record.levelno < logging.WARNING and self.queue.qsize() >= self.soft_limit:
+            self.dropped += 1
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class LogWriter(logging.handlers.QueueListener):
+    """
+    Background thread writing queued records, reporting drops as they happen and
+    access-logging cost every `stats_interval` seconds while under load.
+    """
+
+    def __init__(self, queue_handler: DroppingQueueHandler, handler: logging.Handler, stats_interval: float):
+        super().__init__(queue_handler.queue, handler)
+        self.queue_handler = queue_handler
+        self.reported = 0
+        self.last_report = 0.0
+        self.stats_interval = stats_interval
+        self.last_stats = replace(access_log_stats)
+        self.last_stats_report = time.monotonic()
+        self._stopping = False
+
+    def dequeue(self, block: bool) -> Any:
+        # Wake up regularly so reports go out even when no records arrive
+        while True:
+            try:
+                return self.queue.get(block, timeout=DROPPED_REPORT_INTERVAL)
+            except queue.Empty:
+                self.report_periodic()
+
+    def handle(self, record: logging.LogRecord) -> None:
+        super().handle(record)
+        self.report_periodic()
+
+    def report_periodic(self) -> None:
+        now = time.monotonic()
+        if now - self.last_report >= DROPPED_REPORT_INTERVAL:
+            self.report_dropped()
+        if self.stats_interval > 0 and now - self.last_stats_report >= self.stats_interval:
+            self.report_stats(now)
+
+    def report_stats(self, now: float) -> None:
+        current = replace(access_log_stats)
+        interval = current - self.last_stats
+        interval_s = now - self.last_stats_report
+        self.last_stats, self.last_stats_report = current, now
+        if interval.requests == 0:
+            return
+
+        # Goes through the queue like any other record, so it is rendered as structured fields
+        structlog.get_logger(__name__).info(
+            "Access log stats",
+            interval_s=round(interval_s, 1),
+            dropped_log_records=self.queue_handler.dropped,
+            **interval.as_dict(),
+        )
+
+    def enqueue_sentinel(self) -> None:
+        # The sentinel must always fit: discard the oldest queued records to make room
+        while True:
+            try:
+                self.queue.put_nowait(self._sentinel)
+                return
+            except queue.Full:
+                try:
+                    self.queue.get_nowait()
+                    self.queue.task_done()
+                    self.queue_handler.dropped += 1
+                except queue.Empty:
+                    pass
+
+    def stop(self, timeout: Optional[float] = None) -> bool:
+        """
+        Ask the writer to drain and exit, waiting at most `timeout` seconds.
+        Returns False if it is still running, e.g. blocked on a stalled stream.
+        """
+        if self._thread is None:
+            return True
+        if not self._stopping:
+            self._stopping = True
+            self.enqueue_sentinel()
+
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            return False
+
+        self._thread = None
+        self.report_dropped()
+        return True
+
+    def report_dropped(self) -> None:
+        dropped = self.queue_handler.dropped
+        if dropped <= self.reported:
+            return
+
+        super().handle(logging.makeLogRecord({
+            "name": __name__,
+            "levelno": logging.WARNING,
+            "levelname": "WARNING",
+            "msg": "Log queue full, dropped %d records (%d total)",
+            "args": (dropped - self.reported, dropped),
+        }))
+        self.reported = dropped
+        self.last_report = time.monotonic()
+
+
+def _capture_exc_info(logger: Any, method_name: str, event_dict: Dict[str, Any]) -> Dict[str, Any]:
+    # Tracebacks are rendered on the writer thread, where sys.exc_info() is empty
+    if event_dict.get("exc_info") is True:
+        event_dict["exc_info"] = sys.exc_info()
+    return event_dict
+
+
 def setup_logging():
     """
     Configure structured logging for the application.
+
+    Records are written synchronously until `start_log_writer` moves rendering and
+    writing to a background thread for the lifetime of the app.
     """
+    global _stream_handler
+
     shared_processors = [
         structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_logger_name,
@@ -17,42 +207,47 @@ def setup_logging():
         structlog.processors.TimeStamper(fmt="iso"),
     ]
 
+    structlog.configure(
+        processors=shared_processors + [
+            _capture_exc_info,
+            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
+        ],
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        wrapper_class=structlog.stdlib.BoundLogger,
+        cache_logger_on_first_use=True,
+    )
+
     if settings.ENV == "production":
-        processors = shared_processors + [
+        renderers = [
             structlog.processors.dict_tracebacks,
             structlog.processors.JSONRenderer(),
         ]
     else:
         # Development mode - pretty printing
-        processors = shared_processors + [
+        renderers = [
             structlog.dev.ConsoleRenderer(),
         ]
 
-    structlog.configure(
-        processors=processors,
-        logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
-        cache_logger_on_first_use=True,
-    )
-
     # Configure standard library logging to use structlog
     formatter = structlog.stdlib.ProcessorFormatter(
         foreign_pre_chain=shared_processors,
-        processors=[
-            structlog.stdlib.ProcessorFormatter.remove_processors_meta,
-            structlog.processors.JSONRenderer() if settings.ENV == "production" else structlog.dev.ConsoleRenderer(),
-        ],
+        processors=[structlog.stdlib.ProcessorFormatter.remove_processors_meta] + renderers,
     )
 
     handler = logging.StreamHandler(sys.stdout)
     handler.setFormatter(formatter)
 
     root_logger = logging.getLogger()
+    stop_log_writer()
+    if _stream_handler is not None:
+        root_logger.removeHandler(_stream_handler)
+    _stream_handler = handler
     root_logger.addHandler(handler)
     root_logger.setLevel(settings.LOG_LEVEL)
 
     # Silence noisy libraries
     logging.getLogger("uvicorn.access").handlers = []  # handled by our middleware
+    logging.getLogger("uvicorn.access").propagate = False
     logging.getLogger("uvicorn.error").handlers = []
 
     # Re-propagate uvicorn logs to root
@@ -63,4 +258,71 @@ def setup_logging():
     return structlog.get_logger()
 
 
-logger = structlog.get_logger()
\ No newline at end of file
+def start_log_writer():
+    """
+    Route root logging through a bounded queue to a background writer thread,
+    so log calls on the event loop never wait on stdout.
+    """
+    global _queue_handler, _log_writer
+
+    if _log_writer is not None or _stream_handler is None:
+        return
+
+    size = settings.LOG_QUEUE_SIZE
+    _queue_handler = DroppingQueueHandler(
+        queue.Queue(maxsize=size), reserved=max(int(size * LOG_QUEUE_RESERVED_FRACTION), 1)
+    )
+    _log_writer = LogWriter(_queue_handler, _stream_handler, settings.LOG_STATS_INTERVAL)
+    _log_writer.start()
+
+    root_logger = logging.getLogger()
+    root_logger.addHandler(_queue_handler)
+    root_logger.removeHandler(_stream_handler)
+
+
+def stop_log_writer():
+    """
+    Flush queued records, stop the writer thread and go back to writing synchronously.
+    Handlers are only swapped once the writer has actually stopped.
+    """
+    global _queue_handler, _log_writer
+
+    if _log_writer is None:
+        return
+
+    if not _log_writer.stop(timeout=LOG_WRITER_STOP_TIMEOUT):
+        # Stream is stalled: keep the non-blocking queue in place rather than write synchronously.
+        # The daemon writer exits on its own once the stream drains up to the sentinel.
+        return
+
+    root_logger = logging.getLogger()
+    root_logger.addHandler(_stream_handler)
+    root_logger.removeHandler(_queue_handler)
+    _queue_handler = None
+    _log_writer = None
+
+
+def dropped_log_records() -> int:
+    """Number of records dropped because the log queue was full."""
+    return _queue_handler.dropped if _queue_handler is not None else 0
+
+
+def annotate_access_log(**fields: Any) -> None:
+    """
+    Attach fields (e.g. app_name) to the current request's access log entry.
+    """
+    current = access_log_fields.get()
+    if current is not None:
+        current.update(fields)
+
+
+def count_access_log_rows(rows: int) -> None:
+    """
+    Add to the number of metadata rows served by the current request.
+    """
+    current = access_log_fields.get()
+    if current is not None:
+        current["row_count"] = current.get("row_count", 0) + rows
+
+
+logger = structlog.get_logger()
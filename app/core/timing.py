@@ -0,0 +1,47 @@
+import time
+from contextlib import nullcontext
+from contextvars import ContextVar
+from typing import ContextManager, Dict, Optional
+
+
+class RequestTimings:
+    """Wall-clock phase durations (seconds) collected for one profiled request."""
+
+    def __init__(self):
+        self.spans: Dict[str, float] = {}
+        self.endpoint_finished: Optional[float] = None
+
+    def add(self, phase: str, seconds: float) -> None:
+        self.spans[phase] = self.spans.get(phase, 0.0) + seconds
+
+
+# Set only while a request is being profiled; None keeps `timed` a no-op otherwise
+request_timings: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+_NOT_PROFILED = nullcontext()
+
+
+class _Span:
+    __slots__ = ("phase", "timings", "started")
+
+    def __init__(self, phase: str, timings: RequestTimings):
+        self.phase = phase
+        self.timings = timings
+
+    def __enter__(self) -> "_Span":
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.timings.add(self.phase, time.perf_counter() - self.started)
+
+
+def timed(phase: str) -> ContextManager:
+    """
+    Context manager adding the wall-clock time of its block to the current request's phase.
+    Outside a profiled request it returns a shared no-op, costing only the contextvar lookup.
+    """
+    timings = request_timings.get()
+    if timings is None:
+        return _NOT_PROFILED
+    return _Span(phase, timings)
@@ -4,7 +4,9 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
-from app.core.logging import setup_logging, logger
+from app.core.logging import (
+    setup_logging, start_log_writer, stop_log_writer, dropped_log_records, access_log_stats, logger
+)
 from app.core.exceptions import TableNotFoundException, DatabaseError, DQMetadataException
 from app.api.error_handlers import (
     table_not_found_handler,
@@ -13,11 +15,15 @@ from app.api.error_handlers import (
 )
 from app.api import endpoints
 from app.core.heuristics import HeuristicsLoader
+from app.middleware.access_log import AccessLogMiddleware
+from app.middleware.compression import CompressionMiddleware
+from app.middleware.profiling import ProfilingMiddleware
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
+    start_log_writer()
     logger.info("Starting dq-metadata service", env=settings.ENV)
     try:
         # Pre-load heuristics to fail fast if config is invalid
@@ -25,12 +31,18 @@ async def lifespan(app: FastAPI):
         logger.info("Heuristics loaded successfully")
     except Exception as e:
         logger.critical("Failed to initialize service", error=str(e))
+        stop_log_writer()
         raise e
     
     yield
     
     # Shutdown
-    logger.info("Shutting down dq-metadata service")
+    logger.info(
+        "Shutting down dq-metadata service",
+        dropped_log_records=dropped_log_records(),
+        **access_log_stats.as_dict(),
+    )
+    stop_log_writer()
 
 
 def create_app() -> FastAPI:
@@ -52,6 +64,31 @@ def create_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    if settings.COMPRESSION_ENABLED:
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+            cache_max_bytes=settings.COMPRESSION_CACHE_MAX_BYTES,
+            cache_max_entry_bytes=settings.COMPRESSION_CACHE_MAX_ENTRY_BYTES,
+            threadpool_min_size=settings.COMPRESSION_THREADPOOL_MIN_SIZE,
+        )
+    if settings.ACCESS_LOG_ENABLED:
+        app.add_middleware(
+            AccessLogMiddleware,
+            sample_rate=settings.ACCESS_LOG_SAMPLE_RATE,
+            slow_ms=settings.ACCESS_LOG_SLOW_MS,
+        )
+    # Outermost, so profiled requests include compression work.
+    # Not installed unless enabled; see the profiling settings for the cost when it is.
+    if settings.PROFILING_ENABLED and not settings.PROFILING_TOKEN:
+        logger.warning("PROFILING_ENABLED is set but PROFILING_TOKEN is empty; profiling disabled")
+    elif settings.profiling_active:
+        app.add_middleware(
+            ProfilingMiddleware,
+            header=settings.PROFILING_HEADER,
+            token=settings.PROFILING_TOKEN,
+            output_dir=settings.PROFILING_OUTPUT_DIR,
+        )
 
     # Routes
     app.include_router(endpoints.router, prefix="/metadata", tags=["Metadata"])
@@ -0,0 +1,77 @@
+import random
+import time
+from typing import Any, Dict
+
+import structlog
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.exceptions import ConfigurationError
+from app.core.logging import access_log_fields, access_log_stats
+
+
+access_logger = structlog.get_logger("dq_metadata.access")
+
+
+class AccessLogMiddleware:
+    """
+    ASGI middleware logging one line per request with latency, status, app_name and row count.
+
+    Fast successful requests are sampled at `sample_rate` and logged at info; slow requests
+    and 4xx are always logged at warning, 5xx at error.
+    """
+
+    def __init__(self, app: ASGIApp, sample_rate: float = 1.0, slow_ms: float = 1000.0):
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ConfigurationError(f"Access log sample_rate must be within [0, 1], got {sample_rate}")
+        self.app = app
+        self.sample_rate = sample_rate
+        self.slow_ms = slow_ms
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        fields: Dict[str, Any] = {}
+        token = access_log_fields.set(fields)
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            access_log_fields.reset(token)
+            self._log(scope, status_code, (time.perf_counter() - started) * 1000, fields)
+
+    def _log(self, scope: Scope, status_code: int, duration_ms: float, fields: Dict[str, Any]) -> None:
+        access_log_stats.requests += 1
+        sampled = status_code < 400 and duration_ms < self.slow_ms
+        if sampled and random.random() >= self.sample_rate:
+            access_log_stats.sampled_out += 1
+            return
+
+        if status_code >= 500:
+            log = access_logger.error
+        elif status_code >= 400 or duration_ms >= self.slow_ms:
+            log = access_logger.warning
+        else:
+            log = access_logger.info
+
+        log_started = time.perf_counter_ns()
+        log(
+            "request",
+            method=scope["method"],
+            path=scope["path"],
+            status=status_code,
+            duration_ms=round(duration_ms, 2),
+            sample_rate=self.sample_rate if sampled else 1.0,
+            **fields,
+        )
+        access_log_stats.logged += 1
+        access_log_stats.log_time_ns += time.perf_counter_ns() - log_started
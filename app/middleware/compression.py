@@ -0,0 +1,254 @@
+import gzip
+import hashlib
+import zlib
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+try:
+    import zstandard
+except ImportError:  # zstd is optional; gzip is always available
+    zstandard = None
+
+T = TypeVar("T")
+
+# Preferred order when the client accepts several encodings with equal weight
+SUPPORTED_ENCODINGS: List[str] = ["zstd", "gzip"] if zstandard is not None else ["gzip"]
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Pick the best supported encoding from an Accept-Encoding header, or None for identity.
+    """
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        token, _, params = item.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[token] = q
+
+    wildcard = weights.get("*", 0.0)
+    best: Optional[str] = None
+    best_q = 0.0
+    for encoding in SUPPORTED_ENCODINGS:
+        q = weights.get(encoding, wildcard)
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+class StreamCompressor:
+    """
+    Incremental compressor; every chunk is flushed so clients can decode it on arrival.
+    """
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "zstd":
+            self._zstd = zstandard.ZstdCompressor(level=settings.COMPRESSION_ZSTD_LEVEL).compressobj()
+        else:
+            self._zlib = zlib.compressobj(settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, chunk: bytes) -> bytes:
+        if self.encoding == "zstd":
+            return self._zstd.compress(chunk) + self._zstd.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+        return self._zlib.compress(chunk) + self._zlib.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self.encoding == "zstd":
+            return self._zstd.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+        return self._zlib.flush(zlib.Z_FINISH)
+
+
+class CompressedBodyCache:
+    """
+    LRU of compressed bodies keyed by encoding and a digest of the raw body, bounded by
+    total compressed bytes. Repeated hits for an unchanged context skip compression.
+    """
+
+    def __init__(self, max_bytes: int, max_entry_bytes: int):
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = min(max_entry_bytes, max_bytes)
+        self.size = 0
+        self._entries: "OrderedDict[Tuple[str, bytes], bytes]" = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    @staticmethod
+    def key(encoding: str, body: bytes) -> Tuple[str, bytes]:
+        return encoding, hashlib.blake2b(body, digest_size=16).digest()
+
+    def get(self, key: Tuple[str, bytes]) -> Optional[bytes]:
+        cached = self._entries.get(key)
+        if cached is not None:
+            self._entries.move_to_end(key)
+        return cached
+
+    def put(self, key: Tuple[str, bytes], compressed: bytes) -> None:
+        if len(compressed) > self.max_entry_bytes or key in self._entries:
+            return
+
+        self._entries[key] = compressed
+        self.size += len(compressed)
+        while self.size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= len(evicted)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size = 0
+
+
+def compress_body(encoding: str, body: bytes) -> bytes:
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=settings.COMPRESSION_ZSTD_LEVEL).compress(body)
+    return gzip.compress(body, compresslevel=settings.COMPRESSION_GZIP_LEVEL, mtime=0)
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware negotiating gzip/zstd response compression via Accept-Encoding.
+    """
+
+    def __init__(
+            self,
+            app: ASGIApp,
+            minimum_size: int = 500,
+            cache_max_bytes: int = 32 * 1024 * 1024,
+            cache_max_entry_bytes: int = 4 * 1024 * 1024,
+            threadpool_min_size: int = 64 * 1024,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.threadpool_min_size = threadpool_min_size
+        self.cache = CompressedBodyCache(cache_max_bytes, cache_max_entry_bytes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+    async def compress(self, encoding: str, body: bytes, cacheable: bool) -> bytes:
+        """
+        Compress a complete body, reusing cached output for successful responses.
+        """
+        key = None
+        if cacheable and self.cache.enabled:
+            key = await self.run(body, CompressedBodyCache.key, encoding, body)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        compressed = await self.run(body, compress_body, encoding, body)
+        if key is not None:
+            self.cache.put(key, compressed)
+        return compressed
+
+    async def run(self, body: bytes, func: Callable[..., T], *args: Any) -> T:
+        # Hashing/compressing multi-MB bodies would stall every request on the event loop
+        if len(body) >= self.threadpool_min_size:
+            return await run_in_threadpool(func, *args)
+        return func(*args)
+
+
+class _CompressionResponder:
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self.downstream = send
+        self.start_message: Optional[Message] = None
+        self.cacheable = False
+        self.compressor: Optional[StreamCompressor] = None
+        self.passthrough = False
+
+    async def send(self, message: Message) -> None:
+        message_type = message["type"]
+
+        if message_type == "http.response.start":
+            self.start_message = message
+            headers = Headers(raw=message["headers"])
+            # Never double-encode a body the endpoint already compressed
+            self.passthrough = "content-encoding" in headers
+            # Only successful JSON payloads (contexts) are worth caching; skip errors and /docs
+            self.cacheable = (
+                200 <= message["status"] < 300
+                and headers.get("content-type", "").startswith("application/json")
+            )
+            return
+
+        if message_type != "http.response.body":
+            await self.downstream(message)
+            return
+
+        if self.passthrough:
+            await self._flush_start()
+            await self.downstream(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.compressor is None and self.start_message is not None:
+            if not more_body:
+                # Complete response in a single message
+                if len(body) < self.middleware.minimum_size:
+                    await self._flush_start()
+                    await self.downstream(message)
+                    return
+
+                compressed = await self.middleware.compress(self.encoding, body, self.cacheable)
+                headers = self._encoded_headers()
+                headers["Content-Length"] = str(len(compressed))
+                await self._flush_start()
+                await self.downstream({"type": "http.response.body", "body": compressed})
+                return
+
+            # Streaming response: compress incrementally
+            self.compressor = StreamCompressor(self.encoding)
+            headers = self._encoded_headers()
+            del headers["Content-Length"]
+            await self._flush_start()
+
+        if self.compressor is None:
+            await self.downstream(message)
+            return
+
+        chunk = await self.middleware.run(body, self.compressor.compress, body) if body else b""
+        if not more_body:
+            chunk += self.compressor.finish()
+        await self.downstream({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+    def _encoded_headers(self) -> MutableHeaders:
+        headers = MutableHeaders(raw=self.start_message["headers"])
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        return headers
+
+    async def _flush_start(self) -> None:
+        if self.start_message is not None:
+            await self.downstream(self.start_message)
+            self.start_message = None
@@ -0,0 +1,120 @@
+import cProfile
+import os
+import re
+import secrets
+import time
+from typing import Tuple
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.logging import logger
+from app.core.timing import RequestTimings, request_timings
+
+
+# Phases reported in Server-Timing, in order; recorded with app.core.timing.timed
+PHASES: Tuple[str, ...] = ("query", "group", "summary", "serialize")
+
+
+def server_timing(total: float, timings: RequestTimings) -> str:
+    entries = [f'total;dur={total * 1000:.2f};desc="wall clock"']
+    entries.extend(f"{phase};dur={timings.spans.get(phase, 0.0) * 1000:.2f}" for phase in PHASES)
+    return ", ".join(entries)
+
+
+class ProfilingMiddleware:
+    """
+    ASGI middleware that profiles individual requests carrying the guarded profiling header.
+
+    The response carries a Server-Timing header with wall-clock durations of the request's
+    own phases (query incl. ORM hydration, grouping, summaries, serialization), tracked per
+    request through a contextvar.
+
+    The cProfile output is written as a .pstats file (loadable by pstats, snakeviz or
+    flameprof). cProfile covers the whole event-loop thread, so the file also contains work
+    from any requests running concurrently with the profiled one; it does not count time a
+    coroutine spends suspended, e.g. waiting on the database.
+    """
+
+    def __init__(self, app: ASGIApp, header: str, token: str, output_dir: str):
+        self.app = app
+        self.header = header.lower()
+        self.token = token
+        self.output_dir = output_dir
+        # cProfile cannot run two profilers on one thread; profile one request at a time
+        self._active = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._is_authorized(scope):
+            await self.app(scope, receive, send)
+            return
+
+        if self._active:
+            logger.info("Profiling skipped, another request is being profiled", path=scope.get("path"))
+
+            async def send_skipped(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    MutableHeaders(scope=message)["X-DQ-Profile-Skipped"] = "busy"
+                await send(message)
+
+            await self.app(scope, receive, send_skipped)
+            return
+
+        self._active = True
+        try:
+            await self._profile(scope, receive, send)
+        finally:
+            self._active = False
+
+    def _is_authorized(self, scope: Scope) -> bool:
+        value = Headers(scope=scope).get(self.header)
+        if value is None:
+            return False
+        # Headers are latin-1 decoded; compare raw bytes, since compare_digest rejects non-ASCII str
+        return secrets.compare_digest(value.encode("latin-1"), self.token.encode("utf-8"))
+
+    async def _profile(self, scope: Scope, receive: Receive, send: Send) -> None:
+        profiler = cProfile.Profile()
+        timings = RequestTimings()
+        token = request_timings.set(timings)
+        filename = self._profile_filename(scope)
+        started = time.perf_counter()
+        stopped = False
+
+        def stop() -> None:
+            nonlocal stopped
+            if not stopped:
+                profiler.disable()
+                stopped = True
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Bodies are rendered before the start message, so the breakdown is complete here
+                stop()
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", server_timing(time.perf_counter() - started, timings))
+                headers["X-DQ-Profile-File"] = filename
+            await send(message)
+
+        profiler.enable()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            stop()
+            request_timings.reset(token)
+            path = os.path.join(self.output_dir, filename)
+            try:
+                await run_in_threadpool(self._dump, profiler, path)
+                logger.info("Request profile written", path=scope.get("path"), profile=path)
+            except OSError as e:
+                logger.error("Failed to write request profile", profile=path, error=str(e))
+
+    def _profile_filename(self, scope: Scope) -> str:
+        slug = re.sub(r"[^A-Za-z0-9]+", "_", scope.get("path", "")).strip("_") or "root"
+        return f"{time.strftime('%Y%m%dT%H%M%S')}-{time.time_ns() % 1_000_000:06d}-{slug}.pstats"
+
+    @staticmethod
+    def _dump(profiler: cProfile.Profile, path: str) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        profiler.dump_stats(path)
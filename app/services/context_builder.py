@@ -4,6 +4,8 @@ from app.repositories.metadata_repo import MetadataRepository
 from app.services.enrichment import EnrichmentService
 from app.schemas.metadata import AppMetadataResponse
 from app.models.metadata import MetadataColumn
+from app.core.logging import count_access_log_rows
+from app.core.timing import timed
 
 
 class ContextBuilderService:
@@ -22,28 +24,33 @@ class ContextBuilderService:
         return results
 
     async def build_app_context(self, app_name: str, schema: Optional[str] = None) -> AppMetadataResponse:
-        raw_columns = await self.repo.get_app_columns(app_name, schema)
+        # Includes ORM hydration: AsyncSession.execute prebuffers the rows
+        with timed("query"):
+            raw_columns = await self.repo.get_app_columns(app_name, schema)
+        count_access_log_rows(len(raw_columns))
 
         # Group by schema -> table
         content: Dict[str, Dict[str, List[MetadataColumn]]] = {}
-        for col in raw_columns:
-            # Handle None schema by using a default value
-            sch = col.table_schema if col.table_schema is not None else "default"
-            tbl = col.table_name if col.table_name is not None else "unknown"
-
-            if sch not in content:
-                content[sch] = {}
-            if tbl not in content[sch]:
-                content[sch][tbl] = []
-            content[sch][tbl].append(col)
+        with timed("group"):
+            for col in raw_columns:
+                # Handle None schema by using a default value
+                sch = col.table_schema if col.table_schema is not None else "default"
+                tbl = col.table_name if col.table_name is not None else "unknown"
+
+                if sch not in content:
+                    content[sch] = {}
+                if tbl not in content[sch]:
+                    content[sch][tbl] = []
+                content[sch][tbl].append(col)
 
         # Generate Summaries
         final_dict: Dict[str, Dict[str, str]] = {}
 
-        for sch, tables in content.items():
-            final_dict[sch] = {}
-            for tbl, cols in tables.items():
-                final_dict[sch][tbl] = self._generate_nl_summary(tbl, cols)
+        with timed("summary"):
+            for sch, tables in content.items():
+                final_dict[sch] = {}
+                for tbl, cols in tables.items():
+                    final_dict[sch][tbl] = self._generate_nl_summary(tbl, cols)
 
         return AppMetadataResponse(
             app_name=app_name,